@@ -5,13 +5,20 @@ Fetches paper information from arXiv, Google Scholar, Semantic Scholar, and othe
 Format: **Paper Title** FirstAuthor et al. Year. Venue. Citations: N
 """
 
+import io
+import os
 import sys
 import re
-import requests
-from bs4 import BeautifulSoup
+import functools
+import sqlite3
+from contextlib import closing
+from urllib.parse import quote
+# requests, bs4, requests-cache, lxml, orjson and concurrent.futures are imported where
+# they are used, so that offline runs (--test) do not pay for loading them
 import json
 import argparse
 import time
+import threading
 
 # Set request headers to avoid being blocked
 HEADERS = {
@@ -21,17 +28,281 @@ HEADERS = {
 # Debug mode flag
 DEBUG_MODE = False
 
+# On-disk response cache (used when requests-cache is installed), stored next to this script
+CACHE_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.paper_cache')
+CACHE_EXPIRE_SECONDS = 86400
+
+# Google Scholar citation counts already scraped, keyed by normalized title; lets repeated
+# lookups skip the throttled Scholar request entirely
+CITATION_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.citation_cache.sqlite')
+
+# Precompiled patterns
+# Paper URLs
+ARXIV_RE = re.compile(r'arxiv\.org/(?:abs|pdf)/(\d+\.\d+)')
+SEMANTIC_SCHOLAR_RE = re.compile(r'semanticscholar\.org/paper/(?:[^/]+/)?([a-f0-9]+)')
+# OpenReview (supports more characters, including underscores and hyphens)
+OPENREVIEW_RE = re.compile(r'openreview\.net/(?:forum|pdf)\?id=([A-Za-z0-9_\-]+)')
+DOI_RE = re.compile(r'doi\.org/(10\.\d+/[^\s]+)')
+# Page contents
+DATELINE_YEAR_RE = re.compile(r'(\d{4})')
+OPENREVIEW_YEAR_RE = re.compile(r'20\d{2}')
+YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+VENUE_YEAR_SUFFIX_RE = re.compile(r',?\s*(19|20)\d{2}')
+TITLE_PREFIX_RE = re.compile(r'^\[(PDF|BOOK|HTML)\]\s*')
+CITED_BY_RE = re.compile(r'Cited by (\d+)')
+
+# Conferences recognized in arXiv comments, matched in a single pass over the text
+# (leading word boundary so that e.g. "NAACL" is not taken for "ACL")
+CONF_LIST = ['NeurIPS', 'ICLR', 'ICML', 'CVPR', 'ICCV', 'ECCV', 'ACL', 'EMNLP', 'AAAI']
+CONF_RE = re.compile(r'\b(' + '|'.join(CONF_LIST) + ')')
+CONF_YEAR_RES = {conf: re.compile(rf'{conf}\s*(\d{{4}})') for conf in CONF_LIST}
+
+# Google Scholar bans clients that query too fast: keep requests at least this many
+# seconds apart, and wait this long before retrying once when rate limited (HTTP 429)
+GOOGLE_SCHOLAR_MIN_INTERVAL = 2.0
+GOOGLE_SCHOLAR_RETRY_DELAY = 30
+
+# In default mode, how long to wait for Semantic Scholar before also asking Google Scholar
+GS_RACE_DELAY = 3.0
+
+_LAST_GS_CALL = 0.0
+_GS_LOCK = threading.Lock()
+
+# Number of papers fetched in parallel in batch mode (--input-file)
+BATCH_WORKERS = 8
+
+# Semantic Scholar batch API, accepting at most SEMANTIC_SCHOLAR_BATCH_SIZE IDs per request
+SEMANTIC_SCHOLAR_BATCH_URL = "https://api.semanticscholar.org/graph/v1/paper/batch"
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500
+
+# Semantic Scholar records fetched by get_semantic_scholar_batch, keyed by paper ID
+# (e.g. "arXiv:1706.03762", "DOI:10.xxx/yyy"); None marks papers that were not found
+_SEMANTIC_SCHOLAR_RECORDS = {}
+
+
+def create_session():
+    """Create an HTTP session that reuses connections and retries transient errors"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    try:
+        import requests_cache
+    except ImportError:
+        requests_cache = None
+
+    session = None
+    if requests_cache is not None:
+        # Responses are pure functions of the paper ID, so cache successful ones across runs
+        try:
+            session = requests_cache.CachedSession(cache_name=CACHE_NAME, backend='sqlite',
+                                                   expire_after=CACHE_EXPIRE_SECONDS,
+                                                   allowable_codes=[200])
+            # Make sure the cache database can be read and written before relying on it
+            len(session.cache.responses)
+            with closing(sqlite3.connect(session.cache.db_path)) as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.rollback()
+        except (OSError, sqlite3.Error) as e:
+            if DEBUG_MODE:
+                print(f"Debug: Response cache unavailable, not caching: {e}", file=sys.stderr)
+            session = None
+    if session is None:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    # Back off and retry on rate limiting (429) and server errors
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Google Scholar rate limiting is handled by google_scholar_get alone, so do not
+    # retry 429 (or wait on Retry-After) here as well
+    scholar_retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                          respect_retry_after_header=False, raise_on_status=False)
+    session.mount('https://scholar.google.com/', HTTPAdapter(max_retries=scholar_retry))
+    # The Semantic Scholar batch lookup is a read sent as POST, which Retry skips by default
+    batch_retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=frozenset(['POST']), raise_on_status=False)
+    session.mount(SEMANTIC_SCHOLAR_BATCH_URL, HTTPAdapter(max_retries=batch_retry))
+    return session
+
+
+# Shared session, keeps connections alive across requests to the same host
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session():
+    """Return the shared HTTP session, creating it on first use"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = create_session()
+    return _SESSION
+
+
+@functools.lru_cache(maxsize=None)
+def html_parser():
+    """Return the fastest installed BeautifulSoup parser"""
+    try:
+        import lxml  # noqa: F401 -- only checked for availability, used by BeautifulSoup
+        return 'lxml'
+    except ImportError:
+        return 'html.parser'
+
+
+def google_scholar_get(url, cancelled=None):
+    """GET a Google Scholar page, spacing out requests and retrying once on HTTP 429
+
+    Returns None without sending a request if the cancelled event is set by the
+    time this call gets its turn.
+    """
+    with _GS_LOCK:
+        if cancelled is not None and cancelled.is_set():
+            return None
+        response = _spaced_google_scholar_get(url)
+        if response.status_code == 429:
+            print(f"Google Scholar rate limited, retrying in {GOOGLE_SCHOLAR_RETRY_DELAY}s", file=sys.stderr)
+            time.sleep(GOOGLE_SCHOLAR_RETRY_DELAY)
+            if cancelled is not None and cancelled.is_set():
+                return None
+            response = _spaced_google_scholar_get(url)
+    return response
+
+
+def _spaced_google_scholar_get(url):
+    """GET a Google Scholar page at least GOOGLE_SCHOLAR_MIN_INTERVAL after the previous one
+
+    Must be called with _GS_LOCK held.
+    """
+    global _LAST_GS_CALL
+    delta = time.time() - _LAST_GS_CALL
+    if delta < GOOGLE_SCHOLAR_MIN_INTERVAL:
+        time.sleep(GOOGLE_SCHOLAR_MIN_INTERVAL - delta)
+    response = get_session().get(url, timeout=10)
+    # Responses served from the cache do not count against the rate limit
+    if not getattr(response, 'from_cache', False):
+        _LAST_GS_CALL = time.time()
+    return response
+
+
+def _open_citation_cache():
+    """Open the citation cache database, creating the table if needed"""
+    conn = sqlite3.connect(CITATION_CACHE_PATH)
+    conn.execute('CREATE TABLE IF NOT EXISTS citations '
+                 '(key TEXT PRIMARY KEY, citations INTEGER, fetched_at REAL)')
+    return conn
+
+
+def get_cached_citations(key):
+    """Return the cached citation count for key, or None if missing or expired"""
+    try:
+        with closing(_open_citation_cache()) as conn:
+            row = conn.execute('SELECT citations, fetched_at FROM citations WHERE key = ?',
+                               (key,)).fetchone()
+    except sqlite3.Error as e:
+        if DEBUG_MODE:
+            print(f"Debug: Citation cache read failed: {e}", file=sys.stderr)
+        return None
+
+    if row and time.time() - row[1] < CACHE_EXPIRE_SECONDS:
+        return row[0]
+    return None
+
+
+def cache_citations(key, citations):
+    """Store a citation count in the citation cache"""
+    try:
+        with closing(_open_citation_cache()) as conn:
+            with conn:
+                conn.execute('INSERT OR REPLACE INTO citations VALUES (?, ?, ?)',
+                             (key, citations, time.time()))
+    except sqlite3.Error as e:
+        if DEBUG_MODE:
+            print(f"Debug: Citation cache write failed: {e}", file=sys.stderr)
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson():
+    """Return the orjson module, or None if it is not installed"""
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
+
+
+def parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def run_in_background(func, *args, **kwargs):
+    """Run func in a daemon thread and return a Future for its result
+
+    Daemon threads are used so that a lookup whose result is no longer needed
+    does not keep the process alive after the output has been printed.
+    """
+    from concurrent.futures import Future
+
+    future = Future()
+
+    def runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=runner, daemon=True).start()
+    return future
+
+
+def first_citation(futures, race_over):
+    """Return the first citation count other than 'N/A' produced by futures
+
+    Futures are given in order of preference, which decides between results that
+    are ready at the same time. race_over is set once the result is known, so
+    lookups still running can skip their remaining requests.
+    """
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    try:
+        pending = list(futures)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in [f for f in pending if f in done]:
+                pending.remove(future)
+                if future.result() != 'N/A':
+                    return future.result()
+        return 'N/A'
+    finally:
+        race_over.set()
+
 
 def fetch_arxiv_info_from_web(arxiv_id):
     """Fetch paper info from arXiv web page (fallback method)"""
+    info = _parse_arxiv_web_page(arxiv_id)
+    # Return a copy, callers update the citation count in place
+    return dict(info) if info else None
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_arxiv_web_page(arxiv_id):
+    """Fetch and parse the arXiv abstract page, memoized per arXiv ID"""
     try:
         url = f"https://arxiv.org/abs/{arxiv_id}"
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = get_session().get(url, timeout=10)
 
         if response.status_code != 200:
             return None
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(response.text, html_parser())
 
         # Title
         title_elem = soup.find('h1', class_='title')
@@ -50,7 +321,7 @@ def fetch_arxiv_info_from_web(arxiv_id):
         dateline = soup.find('div', class_='dateline')
         year = 'N/A'
         if dateline:
-            date_match = re.search(r'(\d{4})', dateline.text)
+            date_match = DATELINE_YEAR_RE.search(dateline.text)
             if date_match:
                 year = date_match.group(1)
 
@@ -60,14 +331,13 @@ def fetch_arxiv_info_from_web(arxiv_id):
         if comments:
             comment_text = comments.text
             # Try to identify common conferences/journals
-            for conf in ['NeurIPS', 'ICLR', 'ICML', 'CVPR', 'ICCV', 'ECCV', 'ACL', 'EMNLP', 'AAAI']:
-                if conf in comment_text:
-                    venue = conf
-                    # Try to extract year
-                    year_match = re.search(rf'{conf}\s*(\d{{4}})', comment_text)
-                    if year_match:
-                        year = year_match.group(1)
-                    break
+            conf_match = CONF_RE.search(comment_text)
+            if conf_match:
+                venue = conf_match.group(1)
+                # Try to extract year
+                year_match = CONF_YEAR_RES[venue].search(comment_text)
+                if year_match:
+                    year = year_match.group(1)
 
         return {
             'title': title,
@@ -91,19 +361,30 @@ def fetch_arxiv_info(arxiv_id):
 
         # Fallback: try API
         url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = get_session().get(url, timeout=10)
 
         if response.status_code != 200:
             print(f"arXiv API returned status {response.status_code}", file=sys.stderr)
             return None
 
-        from xml.etree import ElementTree as ET
-        root = ET.fromstring(response.content)
+        try:
+            from lxml import etree as ET
+            # The feed uses no entities, skip entity resolution
+            parser_options = {'resolve_entities': False, 'huge_tree': False}
+        except ImportError:
+            from xml.etree import ElementTree as ET
+            parser_options = {}
 
         # Namespace
         ns = {'atom': 'http://www.w3.org/2005/Atom'}
-
-        entry = root.find('atom:entry', ns)
+        entry_tag = '{http://www.w3.org/2005/Atom}entry'
+
+        # Stream the feed and stop at the first entry instead of building the whole tree
+        entry = None
+        for _, elem in ET.iterparse(io.BytesIO(response.content), events=('end',), **parser_options):
+            if elem.tag == entry_tag:
+                entry = elem
+                break
         if entry is None:
             return None
 
@@ -118,6 +399,8 @@ def fetch_arxiv_info(arxiv_id):
         # Publication time
         published = entry.find('atom:published', ns).text[:4]  # Year
 
+        entry.clear()
+
         return {
             'title': title,
             'authors': authors,
@@ -143,22 +426,27 @@ def get_citations_from_semantic_scholar(arxiv_id=None, doi=None, title=None):
             # Search paper
             search_url = "https://api.semanticscholar.org/graph/v1/paper/search"
             params = {'query': title, 'limit': 1, 'fields': 'citationCount,title,authors,year,venue'}
-            response = requests.get(search_url, params=params, headers=HEADERS, timeout=10)
+            response = get_session().get(search_url, params=params, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get('data') and len(data['data']) > 0:
                     return data['data'][0].get('citationCount', 'N/A')
             return 'N/A'
         else:
             return 'N/A'
 
+        if paper_id in _SEMANTIC_SCHOLAR_RECORDS:
+            # Already fetched by get_semantic_scholar_batch
+            data = _SEMANTIC_SCHOLAR_RECORDS[paper_id]
+            return data.get('citationCount', 'N/A') if data else 'N/A'
+
         # Get paper information
         url = f"{base_url}{paper_id}"
         params = {'fields': 'citationCount,title,authors,year,venue'}
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
+        response = get_session().get(url, params=params, timeout=10)
 
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             return data.get('citationCount', 'N/A')
 
         return 'N/A'
@@ -167,38 +455,48 @@ def get_citations_from_semantic_scholar(arxiv_id=None, doi=None, title=None):
         return 'N/A'
 
 
-def get_citations_from_google_scholar(title):
-    """Get citation count from Google Scholar"""
-    try:
-        import urllib.parse
+def get_citations_from_google_scholar(title, cancelled=None):
+    """Get citation count from Google Scholar
 
+    If the cancelled event is set before the request is sent, returns 'N/A'
+    without querying Google Scholar.
+    """
+    cache_key = title.strip().lower()
+    cached = get_cached_citations(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
         # Build search URL
-        query = urllib.parse.quote(title)
+        query = quote(title)
         url = f"https://scholar.google.com/scholar?q={query}"
 
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = google_scholar_get(url, cancelled=cancelled)
+        if response is None:
+            return 'N/A'
 
         if response.status_code != 200:
             print(f"Google Scholar returned status {response.status_code}", file=sys.stderr)
             return 'N/A'
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(response.text, html_parser())
 
-        # Find first search result
-        results = soup.find_all('div', class_='gs_ri')
-        if not results:
+        # Make sure there is at least one search result
+        if soup.find('div', class_='gs_ri') is None:
             return 'N/A'
 
         # Find citation info below first result
-        first_result = results[0]
         # Google Scholar citation link format: "Cited by XXX"
-        cite_link = soup.find('a', string=re.compile(r'Cited by \d+'))
+        cite_link = soup.find('a', string=CITED_BY_RE)
 
         if cite_link:
             cite_text = cite_link.text
-            match = re.search(r'Cited by (\d+)', cite_text)
+            match = CITED_BY_RE.search(cite_text)
             if match:
-                return int(match.group(1))
+                citations = int(match.group(1))
+                cache_citations(cache_key, citations)
+                return citations
 
         return 'N/A'
     except Exception as e:
@@ -209,44 +507,62 @@ def get_citations_from_google_scholar(title):
 def search_google_scholar(title):
     """Search Google Scholar and get complete paper information"""
     try:
-        import urllib.parse
-
         # Build search URL
-        query = urllib.parse.quote(title)
+        query = quote(title)
         url = f"https://scholar.google.com/scholar?q={query}"
 
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = google_scholar_get(url)
 
         if response.status_code != 200:
             print(f"Google Scholar search returned status {response.status_code}", file=sys.stderr)
             return None
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        from bs4 import BeautifulSoup, Tag
+        soup = BeautifulSoup(response.text, html_parser())
 
         # Find first search result
-        results = soup.find_all('div', class_='gs_ri')
-        if not results:
+        first_result = soup.find('div', class_='gs_ri')
+        if first_result is None:
             print("No results found in Google Scholar", file=sys.stderr)
             return None
 
-        first_result = results[0]
+        # Collect the title, the author/publication line and the citation count in a
+        # single walk over the result's container (the "Cited by" link may sit next to gs_ri)
+        title_elem = None
+        info_elem = None
+        citations = 'N/A'
+        container = first_result.parent or first_result
+        for elem in container.descendants:
+            if not isinstance(elem, Tag):
+                continue
+            classes = elem.get('class') or []
+            if elem.name == 'h3' and 'gs_rt' in classes:
+                title_elem = title_elem or elem
+            elif elem.name == 'div' and 'gs_a' in classes:
+                info_elem = info_elem or elem
+            elif elem.name == 'a' and citations == 'N/A':
+                match = CITED_BY_RE.search(elem.get_text())
+                if match:
+                    citations = int(match.group(1))
+            if title_elem and info_elem and citations != 'N/A':
+                break
 
         # Title
-        title_elem = first_result.find('h3', class_='gs_rt')
         if not title_elem:
             return None
         title_text = title_elem.get_text().strip()
         # Remove possible [PDF] or [BOOK] prefix
-        title_text = re.sub(r'^\[(PDF|BOOK|HTML)\]\s*', '', title_text)
+        title_text = TITLE_PREFIX_RE.sub('', title_text)
 
         # Authors and publication info
         authors = []
         year = 'N/A'
         venue = 'Unknown'
 
-        info_elem = first_result.find('div', class_='gs_a')
         if info_elem:
-            info_text = info_elem.get_text()
+            # Google Scholar surrounds the separators with non-breaking spaces and may use
+            # en/em dashes, normalize them so the split below works
+            info_text = info_elem.get_text().replace('\xa0', ' ').replace('\u2013', '-').replace('\u2014', '-')
             if DEBUG_MODE:
                 print(f"Debug: gs_a text = {info_text}", file=sys.stderr)
 
@@ -261,15 +577,15 @@ def search_google_scholar(title):
                 authors = [a.strip() for a in author_list if a.strip() and len(a.strip()) > 1]
 
             if len(parts) > 1:
-                # Extract year - search in entire string
-                year_match = re.search(r'\b(19|20)\d{2}\b', info_text)
+                # Extract venue and year - usually in second part
+                venue_text = parts[1].strip()
+
+                year_match = YEAR_RE.search(venue_text)
                 if year_match:
                     year = year_match.group(0)
 
-                # Extract venue - usually in second part
-                venue_text = parts[1].strip()
                 # Remove year
-                venue_text = re.sub(r',?\s*(19|20)\d{2}', '', venue_text).strip()
+                venue_text = VENUE_YEAR_SUFFIX_RE.sub('', venue_text).strip()
                 # Remove possible trailing punctuation
                 venue_text = venue_text.rstrip(',-')
 
@@ -281,41 +597,11 @@ def search_google_scholar(title):
                     elif 'openreview' in venue.lower():
                         venue = 'OpenReview'
 
-        # Citation count - improved search logic
-        citations = 'N/A'
-
-        # Method 1: Find citation links in entire result
-        try:
-            # Find container with current result
-            result_container = first_result.parent
-            if result_container:
-                # Find citation info in container
-                cite_links = result_container.find_all('a')
-                for link in cite_links:
-                    if link.text and 'Cited by' in link.text:
-                        match = re.search(r'Cited by (\d+)', link.text)
-                        if match:
-                            citations = int(match.group(1))
-                            break
-        except Exception as e:
-            if DEBUG_MODE:
-                print(f"Debug: Method 1 failed: {e}", file=sys.stderr)
-
-        # Method 2: Search directly after first result
+        # Citation link not found next to the first result, fall back to the first one on the page
         if citations == 'N/A':
-            try:
-                # gs_fl contains citation, save and other links
-                gs_fl = soup.find_all('div', class_='gs_fl')
-                for fl in gs_fl:
-                    cite_link = fl.find('a', string=re.compile(r'Cited by \d+'))
-                    if cite_link:
-                        match = re.search(r'Cited by (\d+)', cite_link.text)
-                        if match:
-                            citations = int(match.group(1))
-                            break
-            except Exception as e:
-                if DEBUG_MODE:
-                    print(f"Debug: Method 2 failed: {e}", file=sys.stderr)
+            cite_link = soup.find('a', string=CITED_BY_RE)
+            if cite_link:
+                citations = int(CITED_BY_RE.search(cite_link.text).group(1))
 
         if DEBUG_MODE:
             print(f"Debug: Parsed - year={year}, venue={venue}, citations={citations}", file=sys.stderr)
@@ -329,69 +615,105 @@ def search_google_scholar(title):
         }
     except Exception as e:
         print(f"Error searching Google Scholar: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        if DEBUG_MODE:
+            import traceback
+            traceback.print_exc()
         return None
 
 
 def get_semantic_scholar_info(paper_id):
     """Get paper information directly from Semantic Scholar"""
     try:
-        base_url = "https://api.semanticscholar.org/graph/v1/paper/"
-        url = f"{base_url}{paper_id}"
-        params = {'fields': 'citationCount,title,authors,year,venue,publicationVenue'}
+        if paper_id in _SEMANTIC_SCHOLAR_RECORDS:
+            # Already fetched by get_semantic_scholar_batch
+            data = _SEMANTIC_SCHOLAR_RECORDS[paper_id]
+        else:
+            base_url = "https://api.semanticscholar.org/graph/v1/paper/"
+            url = f"{base_url}{paper_id}"
+            params = {'fields': 'citationCount,title,authors,year,venue,publicationVenue'}
 
-        response = requests.get(url, params=params, headers=HEADERS, timeout=10)
+            response = get_session().get(url, params=params, timeout=10)
 
-        time.sleep(0.1)  # Avoid API rate limiting
+            time.sleep(0.1)  # Avoid API rate limiting
 
-        if response.status_code == 200:
-            data = response.json()
-
-            # Get venue information
-            venue = data.get('venue', 'Unknown')
-            if not venue and data.get('publicationVenue'):
-                venue = data['publicationVenue'].get('name', 'Unknown')
-            if not venue:
-                venue = 'Unknown'
-
-            return {
-                'title': data.get('title', 'Unknown'),
-                'authors': [author.get('name') for author in data.get('authors', [])],
-                'year': str(data.get('year', 'N/A')),
-                'venue': venue,
-                'citations': data.get('citationCount', 'N/A')
-            }
+            if response.status_code != 200:
+                return None
+            data = parse_json(response)
 
-        return None
+        if not data:
+            return None
+
+        # Get venue information
+        venue = data.get('venue', 'Unknown')
+        if not venue and data.get('publicationVenue'):
+            venue = data['publicationVenue'].get('name', 'Unknown')
+        if not venue:
+            venue = 'Unknown'
+
+        return {
+            'title': data.get('title', 'Unknown'),
+            'authors': [author.get('name') for author in data.get('authors', [])],
+            'year': str(data.get('year', 'N/A')),
+            'venue': venue,
+            'citations': data.get('citationCount', 'N/A')
+        }
     except Exception as e:
         print(f"Error fetching Semantic Scholar info: {e}", file=sys.stderr)
         return None
 
 
+def get_semantic_scholar_batch(ids):
+    """Get paper records for many papers in as few requests as possible
+
+    Uses the Semantic Scholar batch API, which accepts up to 500 IDs per request.
+    Returns a list aligned with ids (None for papers that were not found) and
+    remembers the records so get_semantic_scholar_info and
+    get_citations_from_semantic_scholar do not fetch them again.
+    """
+    url = SEMANTIC_SCHOLAR_BATCH_URL
+    params = {'fields': 'citationCount,title,authors,year,venue,publicationVenue'}
+
+    records = []
+    for start in range(0, len(ids), SEMANTIC_SCHOLAR_BATCH_SIZE):
+        chunk = ids[start:start + SEMANTIC_SCHOLAR_BATCH_SIZE]
+        try:
+            response = get_session().post(url, params=params, json={'ids': chunk}, timeout=10)
+            if response.status_code != 200:
+                print(f"Semantic Scholar batch API returned status {response.status_code}", file=sys.stderr)
+                records.extend([None] * len(chunk))
+                continue
+            data = parse_json(response)
+        except Exception as e:
+            print(f"Warning: Could not fetch Semantic Scholar batch: {e}", file=sys.stderr)
+            records.extend([None] * len(chunk))
+            continue
+
+        for paper_id, record in zip(chunk, data):
+            _SEMANTIC_SCHOLAR_RECORDS[paper_id] = record
+        records.extend(data)
+
+    return records
+
+
 def parse_url(url):
     """Parse URL, identify source and extract paper ID"""
     # arXiv
-    arxiv_pattern = r'arxiv\.org/(?:abs|pdf)/(\d+\.\d+)'
-    match = re.search(arxiv_pattern, url)
+    match = ARXIV_RE.search(url)
     if match:
         return ('arxiv', match.group(1))
 
     # Semantic Scholar
-    ss_pattern = r'semanticscholar\.org/paper/(?:[^/]+/)?([a-f0-9]+)'
-    match = re.search(ss_pattern, url)
+    match = SEMANTIC_SCHOLAR_RE.search(url)
     if match:
         return ('semantic_scholar', match.group(1))
 
-    # OpenReview (supports more characters, including underscores and hyphens)
-    or_pattern = r'openreview\.net/(?:forum|pdf)\?id=([A-Za-z0-9_\-]+)'
-    match = re.search(or_pattern, url)
+    # OpenReview
+    match = OPENREVIEW_RE.search(url)
     if match:
         return ('openreview', match.group(1))
 
     # DOI
-    doi_pattern = r'doi\.org/(10\.\d+/[^\s]+)'
-    match = re.search(doi_pattern, url)
+    match = DOI_RE.search(url)
     if match:
         return ('doi', match.group(1))
 
@@ -403,12 +725,12 @@ def fetch_openreview_info(paper_id):
     try:
         # OpenReview API
         url = f"https://api.openreview.net/notes?id={paper_id}"
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        response = get_session().get(url, timeout=10)
 
         if response.status_code != 200:
             return None
 
-        data = response.json()
+        data = parse_json(response)
         if not data.get('notes') or len(data['notes']) == 0:
             return None
 
@@ -420,7 +742,7 @@ def fetch_openreview_info(paper_id):
 
         # Infer year from venue
         venue = note.get('invitation', '')
-        year_match = re.search(r'20\d{2}', venue)
+        year_match = OPENREVIEW_YEAR_RE.search(venue)
         year = year_match.group(0) if year_match else 'N/A'
 
         # Infer venue name
@@ -447,26 +769,25 @@ def fetch_openreview_info(paper_id):
         return None
 
 
+def _abbreviate_author(author):
+    """Format a single author as "LastName, I. N." (names without spaces are kept as is)"""
+    parts = author.split()
+    if len(parts) < 2:
+        return author
+    # Last name is at the end, initials come from the other parts
+    last_name = parts[-1]
+    initials = '. '.join(p[0] for p in parts[:-1])
+    return f"{last_name}, {initials}."
+
+
 def format_authors(authors, max_authors=3):
     """Format author list, similar to ICLR citation format"""
     if not authors:
         return "Unknown Authors"
 
     if len(authors) <= max_authors:
-        # Extract last name
-        formatted = []
-        for author in authors:
-            parts = author.split()
-            if len(parts) > 1:
-                # Last name is at the end
-                last_name = parts[-1]
-                # Initials (no trailing period, handled uniformly by format_output)
-                initials = '. '.join([p[0] for p in parts[:-1]])
-                formatted.append(f"{last_name}, {initials}.")
-            else:
-                formatted.append(author)
+        formatted = [_abbreviate_author(author) for author in authors]
 
-        result = ""
         if len(formatted) == 1:
             result = formatted[0]
         elif len(formatted) == 2:
@@ -478,13 +799,7 @@ def format_authors(authors, max_authors=3):
         return result.rstrip('.')
     else:
         # Only show first author et al.
-        parts = authors[0].split()
-        if len(parts) > 1:
-            last_name = parts[-1]
-            initials = '. '.join([p[0] for p in parts[:-1]]) + '.'
-            return f"{last_name}, {initials} et al"  # No period, will be added uniformly later
-        else:
-            return f"{authors[0]} et al"  # No period, will be added uniformly later
+        return f"{_abbreviate_author(authors[0])} et al"  # No period, will be added uniformly later
 
 
 def format_output(paper_info, max_authors=3):
@@ -502,113 +817,94 @@ def format_output(paper_info, max_authors=3):
     return f"**{title}** {authors}. {year}. {venue}. Citations: {citations}"
 
 
-def get_test_paper_info(test_id):
-    """Return test paper information"""
-    test_papers = {
-        '1': {
-            'title': 'Attention Is All You Need',
-            'authors': ['Ashish Vaswani', 'Noam Shazeer', 'Niki Parmar', 'Jakob Uszkoreit', 'Llion Jones', 'Aidan N. Gomez', 'Lukasz Kaiser', 'Illia Polosukhin'],
-            'year': '2017',
-            'venue': 'NeurIPS',
-            'citations': 98234
-        },
-        '2': {
-            'title': 'BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding',
-            'authors': ['Jacob Devlin', 'Ming-Wei Chang', 'Kenton Lee', 'Kristina Toutanova'],
-            'year': '2019',
-            'venue': 'NAACL',
-            'citations': 67890
-        },
-        '3': {
-            'title': 'Learning Transferable Visual Models From Natural Language Supervision',
-            'authors': ['Alec Radford', 'Jong Wook Kim', 'Chris Hallacy', 'Aditya Ramesh', 'Gabriel Goh', 'Sandhini Agarwal', 'Girish Sastry', 'Amanda Askell'],
-            'year': '2021',
-            'venue': 'ICML',
-            'citations': 15678
-        }
+# Offline sample data for --test mode
+TEST_PAPERS = {
+    '1': {
+        'title': 'Attention Is All You Need',
+        'authors': ['Ashish Vaswani', 'Noam Shazeer', 'Niki Parmar', 'Jakob Uszkoreit', 'Llion Jones', 'Aidan N. Gomez', 'Lukasz Kaiser', 'Illia Polosukhin'],
+        'year': '2017',
+        'venue': 'NeurIPS',
+        'citations': 98234
+    },
+    '2': {
+        'title': 'BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding',
+        'authors': ['Jacob Devlin', 'Ming-Wei Chang', 'Kenton Lee', 'Kristina Toutanova'],
+        'year': '2019',
+        'venue': 'NAACL',
+        'citations': 67890
+    },
+    '3': {
+        'title': 'Learning Transferable Visual Models From Natural Language Supervision',
+        'authors': ['Alec Radford', 'Jong Wook Kim', 'Chris Hallacy', 'Aditya Ramesh', 'Gabriel Goh', 'Sandhini Agarwal', 'Girish Sastry', 'Amanda Askell'],
+        'year': '2021',
+        'venue': 'ICML',
+        'citations': 15678
     }
-    return test_papers.get(test_id)
+}
 
 
-def main():
-    parser = argparse.ArgumentParser(description='Fetch paper information and format output')
-    parser.add_argument('url', help='Paper link (supports arXiv, Semantic Scholar, OpenReview) or paper title (--google-scholar) or test ID (--test 1/2/3)')
-    parser.add_argument('--max-authors', type=int, default=3, help='Maximum number of authors to display')
-    parser.add_argument('--test', action='store_true', help='Use test data (offline mode)')
-    parser.add_argument('--google-scholar', action='store_true', help='Use Google Scholar search (input paper title)')
-    parser.add_argument('--use-google-scholar-citations', action='store_true', help='Prioritize Google Scholar for citation counts (more accurate but slower)')
-    parser.add_argument('--debug', action='store_true', help='Show debug information')
+def get_test_paper_info(test_id):
+    """Return test paper information"""
+    return TEST_PAPERS.get(test_id)
 
-    args = parser.parse_args()
 
-    # Set global debug flag
-    global DEBUG_MODE
-    DEBUG_MODE = args.debug
-
-    # Test mode
-    if args.test:
-        paper_info = get_test_paper_info(args.url)
-        if not paper_info:
-            print(f"Error: Test ID '{args.url}' not found. Available: 1, 2, 3", file=sys.stderr)
-            print("\nTest papers:", file=sys.stderr)
-            print("  1: Attention Is All You Need", file=sys.stderr)
-            print("  2: BERT", file=sys.stderr)
-            print("  3: CLIP", file=sys.stderr)
-            sys.exit(1)
-        output = format_output(paper_info, max_authors=args.max_authors)
-        print(output)
-        return
+def process_one_url(url, args):
+    """Fetch paper information for one URL (or paper title with --google-scholar)
 
+    Returns the paper information, or None after reporting the error on stderr.
+    """
     # Google Scholar search mode
     if args.google_scholar:
-        paper_info = search_google_scholar(args.url)
+        paper_info = search_google_scholar(url)
         if not paper_info:
             print(f"Error: Could not find paper on Google Scholar", file=sys.stderr)
-            sys.exit(1)
-        output = format_output(paper_info, max_authors=args.max_authors)
-        print(output)
-        return
+        return paper_info
 
     # Parse URL
-    source, paper_id = parse_url(args.url)
+    source, paper_id = parse_url(url)
 
     if not source:
-        print(f"Error: Unsupported URL format: {args.url}", file=sys.stderr)
+        print(f"Error: Unsupported URL format: {url}", file=sys.stderr)
         print("Supported sources: arXiv, Semantic Scholar, OpenReview", file=sys.stderr)
         print("Or use --google-scholar flag to search by title", file=sys.stderr)
-        sys.exit(1)
+        return None
 
     # Get information based on source
     paper_info = None
 
     if source == 'arxiv':
+        # Semantic Scholar only needs the arXiv ID, so query it while the arXiv page loads
+        ss_future = run_in_background(get_citations_from_semantic_scholar, arxiv_id=paper_id)
         paper_info = fetch_arxiv_info(paper_id)
         # Add citation count
         if paper_info and paper_info.get('citations') == 'N/A':
             # Prioritize Google Scholar (if specified)
             if args.use_google_scholar_citations:
-                citations = get_citations_from_google_scholar(paper_info['title'])
-                if citations != 'N/A':
-                    paper_info['citations'] = citations
-                else:
-                    # Google Scholar failed, try Semantic Scholar
-                    citations = get_citations_from_semantic_scholar(arxiv_id=paper_id)
-                    if citations != 'N/A':
-                        paper_info['citations'] = citations
+                citations = ss_future.result()
+                # A paper Semantic Scholar knows as uncited is not worth a Google Scholar lookup
+                if citations != 0:
+                    gs_citations = get_citations_from_google_scholar(paper_info['title'])
+                    if gs_citations != 'N/A':
+                        citations = gs_citations
             else:
-                # Use Semantic Scholar by default
-                citations = get_citations_from_semantic_scholar(arxiv_id=paper_id)
-                if citations != 'N/A':
-                    paper_info['citations'] = citations
+                # Use Semantic Scholar by default, giving it a head start over Google Scholar
+                from concurrent.futures import wait
+                wait([ss_future], timeout=GS_RACE_DELAY)
+                if ss_future.done() and ss_future.result() != 'N/A':
+                    citations = ss_future.result()
                 else:
-                    # Semantic Scholar failed, try Google Scholar
-                    citations = get_citations_from_google_scholar(paper_info['title'])
-                    if citations != 'N/A':
-                        paper_info['citations'] = citations
+                    # Semantic Scholar is still pending or failed, race it against Google Scholar
+                    race_over = threading.Event()
+                    gs_future = run_in_background(get_citations_from_google_scholar, paper_info['title'],
+                                                  cancelled=race_over)
+                    citations = first_citation([ss_future, gs_future], race_over)
+            if citations != 'N/A':
+                paper_info['citations'] = citations
     elif source == 'semantic_scholar':
         paper_info = get_semantic_scholar_info(paper_id)
         # If Google Scholar specified, try to update citation count
-        if paper_info and args.use_google_scholar_citations and paper_info.get('title'):
+        if (paper_info and args.use_google_scholar_citations and paper_info.get('title')
+                and paper_info.get('citations') != 0):
             gs_citations = get_citations_from_google_scholar(paper_info['title'])
             if gs_citations != 'N/A':
                 paper_info['citations'] = gs_citations
@@ -616,7 +912,8 @@ def main():
         paper_info = fetch_openreview_info(paper_id)
         # OpenReview citation counts may be inaccurate, try Google Scholar update
         if paper_info and paper_info.get('title'):
-            if args.use_google_scholar_citations or paper_info.get('citations') == 'N/A':
+            citations = paper_info.get('citations')
+            if (args.use_google_scholar_citations and citations != 0) or citations == 'N/A':
                 gs_citations = get_citations_from_google_scholar(paper_info['title'])
                 if gs_citations != 'N/A':
                     paper_info['citations'] = gs_citations
@@ -624,13 +921,97 @@ def main():
         # Search via Semantic Scholar
         paper_info = get_semantic_scholar_info(f"DOI:{paper_id}")
         # If Google Scholar specified, try to update citation count
-        if paper_info and args.use_google_scholar_citations and paper_info.get('title'):
+        if (paper_info and args.use_google_scholar_citations and paper_info.get('title')
+                and paper_info.get('citations') != 0):
             gs_citations = get_citations_from_google_scholar(paper_info['title'])
             if gs_citations != 'N/A':
                 paper_info['citations'] = gs_citations
 
     if not paper_info:
         print(f"Error: Could not fetch paper information from {source}", file=sys.stderr)
+    return paper_info
+
+
+def prefetch_semantic_scholar(urls):
+    """Fetch Semantic Scholar records for all URLs up front with batch requests"""
+    ids = []
+    for url in urls:
+        source, paper_id = parse_url(url)
+        if source == 'arxiv':
+            ids.append(f"arXiv:{paper_id}")
+        elif source == 'semantic_scholar':
+            ids.append(paper_id)
+        elif source == 'doi':
+            ids.append(f"DOI:{paper_id}")
+    if ids:
+        get_semantic_scholar_batch(ids)
+
+
+def main_batch(urls, args):
+    """Fetch paper information for many URLs in parallel and print one line per URL
+
+    Returns the number of URLs that could not be fetched.
+    """
+    if not args.google_scholar:
+        prefetch_semantic_scholar(urls)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+        results = list(pool.map(lambda url: process_one_url(url, args), urls))
+
+    # Failed papers still get a line, so output lines match input lines
+    for paper_info in results:
+        print(format_output(paper_info, max_authors=args.max_authors))
+    return sum(1 for paper_info in results if not paper_info)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fetch paper information and format output')
+    parser.add_argument('url', nargs='?', help='Paper link (supports arXiv, Semantic Scholar, OpenReview) or paper title (--google-scholar) or test ID (--test 1/2/3)')
+    parser.add_argument('--max-authors', type=int, default=3, help='Maximum number of authors to display')
+    parser.add_argument('--test', action='store_true', help='Use test data (offline mode)')
+    parser.add_argument('--google-scholar', action='store_true', help='Use Google Scholar search (input paper title)')
+    parser.add_argument('--use-google-scholar-citations', action='store_true', help='Prioritize Google Scholar for citation counts (more accurate but slower)')
+    parser.add_argument('--input-file', help='Read paper links (or titles with --google-scholar) from a file, one per line, and fetch them in parallel')
+    parser.add_argument('--debug', action='store_true', help='Show debug information')
+
+    args = parser.parse_args()
+    if args.url is None and args.input_file is None:
+        parser.error('a paper link or --input-file is required')
+    if args.test and args.url is None:
+        parser.error('--test requires a test ID (1/2/3)')
+    if args.url is not None and args.input_file is not None:
+        parser.error('give either a paper link or --input-file, not both')
+
+    # Set global debug flag
+    global DEBUG_MODE
+    DEBUG_MODE = args.debug
+
+    # Test mode
+    if args.test:
+        paper_info = get_test_paper_info(args.url)
+        if not paper_info:
+            print(f"Error: Test ID '{args.url}' not found. Available: 1, 2, 3", file=sys.stderr)
+            print("\nTest papers:", file=sys.stderr)
+            print("  1: Attention Is All You Need", file=sys.stderr)
+            print("  2: BERT", file=sys.stderr)
+            print("  3: CLIP", file=sys.stderr)
+            sys.exit(1)
+        output = format_output(paper_info, max_authors=args.max_authors)
+        print(output)
+        return
+
+    # Batch mode
+    if args.input_file:
+        with open(args.input_file, encoding='utf-8') as f:
+            urls = [line.strip() for line in f if line.strip()]
+        if main_batch(urls, args):
+            sys.exit(1)
+        return
+
+    paper_info = process_one_url(args.url, args)
+    if not paper_info:
         sys.exit(1)
 
     # Format and output